@@ -1,251 +1,443 @@
-import json
-from datetime import datetime
-
-# Define the menu with prices in Rs.
-menu = {
-    "coffee": 250,
-    "tea": 50,
-    "sandwich": 200,
-    "burger": 350,
-    "fries": 100,
-    "cake": 500
-}
-
-# Tax configuration
-CGST_RATE = 0.09  # 9%
-SGST_RATE = 0.09  # 9%
-PACKAGING_COST = 20  # Flat packaging cost for takeout
-DATA_FILE = 'orders.json'
-
-class Order:
-    def __init__(self, table_number, order_number):
-        self.table_number = table_number
-        self.order_number = order_number
-        self.items = {}
-        self.is_active = True
-        self.include_packaging = False
-        self.order_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    def add_items(self, items):
-        for item_name, quantity in items.items():
-            item_name = item_name.lower()  # Convert item name to lowercase
-            if item_name in menu:
-                if item_name in self.items:
-                    self.items[item_name] += quantity
-                else:
-                    self.items[item_name] = quantity
-                print(f"Added {quantity} {item_name}(s) to the order.")
-            else:
-                print(f"{item_name.capitalize()} is not available on the menu.")
-
-    def calculate_subtotal(self):
-        return sum(menu[item] * quantity for item, quantity in self.items.items())
-
-    def calculate_taxes(self, subtotal):
-        cgst = subtotal * CGST_RATE
-        sgst = subtotal * SGST_RATE
-        return cgst, sgst
-
-    def calculate_total(self):
-        subtotal = self.calculate_subtotal()
-        cgst, sgst = self.calculate_taxes(subtotal)
-        total = subtotal + cgst + sgst
-        if self.include_packaging:
-            total += PACKAGING_COST
-        return total, cgst, sgst
-
-    def close_order(self):
-        self.is_active = False
-        subtotal = self.calculate_subtotal()
-        cgst, sgst = self.calculate_taxes(subtotal)
-        total = subtotal + cgst + sgst
-        if self.include_packaging:
-            total += PACKAGING_COST
-
-        print(f"Order #{self.order_number} for table {self.table_number} closed at {datetime.now()}.\n")
-        print(f"Summary for Table {self.table_number}:")
-        print(f"{'Item':<10}{'Quantity':<10}{'Unit Price (Rs.)':<15}{'Total (Rs.)':<10}")
-        print("-" * 50)
-        for item, quantity in self.items.items():
-            unit_price = menu[item]
-            total_price = unit_price * quantity
-            print(f"{item.capitalize():<10}{quantity:<10}{unit_price:<15}{total_price:<10}")
-        print("-" * 50)
-        print(f"{'Subtotal (Rs.)':<35}{subtotal:<10}")
-        print(f"{'CGST (9%) (Rs.)':<35}{cgst:<10}")
-        print(f"{'SGST (9%) (Rs.)':<35}{sgst:<10}")
-        if self.include_packaging:
-            print(f"{'Packaging Cost (Rs.)':<35}{PACKAGING_COST:<10}")
-        print("-" * 50)
-        print(f"{'Net Total (Rs.)':<35}{total:<10}")
-
-class Cafe:
-    def __init__(self, num_tables=6):
-        self.tables = {i: None for i in range(1, num_tables + 1)}
-        self.orders = {}
-        self.next_order_number = 1
-        self.load_orders()
-
-    def validate_table_number(self, table_number):
-        if table_number < 1 or table_number > 6:
-            print("Invalid table number. Enter a table number between 1 and 6.")
-            return False
-        return True
-
-    def open_order(self, table_number):
-        if not self.validate_table_number(table_number):
-            return
-        if self.tables[table_number] is None:
-            order = Order(table_number, self.next_order_number)
-            self.tables[table_number] = order
-            self.orders[self.next_order_number] = order
-            print(f"Opened new order for table {table_number} with Order #{self.next_order_number}.")
-            self.next_order_number += 1
-            self.save_orders()
-        else:
-            print(f"Table {table_number} already has an active order.")
-
-    def add_items_to_order(self, table_number, items):
-        if not self.validate_table_number(table_number):
-            return
-        order = self.tables[table_number]
-        if order is not None and order.is_active:
-            order.add_items(items)
-            self.save_orders()
-        else:
-            print(f"No active order for table {table_number} to add items to.")
-
-    def close_order(self, table_number):
-        if not self.validate_table_number(table_number):
-            return
-        order = self.tables[table_number]
-        if order is not None and order.is_active:
-            while True:
-                packaging_choice = input("Do you want packaging for this order (yes/no)? ").strip().lower()
-                if packaging_choice in ["yes", "no"]:
-                    order.include_packaging = (packaging_choice == "yes")
-                    break
-                else:
-                    print("Invalid input. Please enter 'yes' or 'no'.")
-            order.close_order()
-            self.tables[table_number] = None
-            self.save_orders()
-        else:
-            print(f"No active order for table {table_number} to close.")
-
-    def save_orders(self):
-        with open(DATA_FILE, 'w') as f:
-            json.dump({order_number: vars(order) for order_number, order in self.orders.items()}, f, indent=4)
-
-    def load_orders(self):
-        try:
-            with open(DATA_FILE, 'r') as f:
-                data = json.load(f)
-                for order_number, order_data in data.items():
-                    order = Order(order_data['table_number'], int(order_number))
-                    order.items = order_data['items']
-                    order.is_active = order_data['is_active']
-                    order.include_packaging = order_data['include_packaging']
-                    order.order_time = order_data['order_time']
-                    self.orders[int(order_number)] = order
-                    if order.is_active:
-                        self.tables[order_data['table_number']] = order
-                self.next_order_number = max(self.orders.keys(), default=0) + 1
-        except FileNotFoundError:
-            pass
-
-    def view_past_orders(self):
-        print("\nCompleted Orders:")
-        for order_number, order in self.orders.items():
-            if not order.is_active:
-                print(f"Order #{order_number} for Table {order.table_number} placed on {order.order_time}")
-
-    def view_order_summary(self, order_number):
-        if order_number in self.orders:
-            order = self.orders[order_number]
-            if not order.is_active:
-                print(f"\nSummary for Order #{order_number}:")
-                print(f"Table: {order.table_number}")
-                print(f"Date & Time: {order.order_time}")
-                print(f"{'Item':<10}{'Quantity':<10}{'Unit Price (Rs.)':<15}{'Total (Rs.)':<10}")
-                print("-" * 50)
-                for item, quantity in order.items.items():
-                    unit_price = menu[item]
-                    total_price = unit_price * quantity
-                    print(f"{item.capitalize():<10}{quantity:<10}{unit_price:<15}{total_price:<10}")
-                subtotal = order.calculate_subtotal()
-                cgst, sgst = order.calculate_taxes(subtotal)
-                total = subtotal + cgst + sgst
-                if order.include_packaging:
-                    total += PACKAGING_COST
-                    print(f"{'Packaging Cost (Rs.)':<35}{PACKAGING_COST:<10}")
-                print("-" * 50)
-                print(f"{'Subtotal (Rs.)':<35}{subtotal:<10}")
-                print(f"{'CGST (9%) (Rs.)':<35}{cgst:<10}")
-                print(f"{'SGST (9%) (Rs.)':<35}{sgst:<10}")
-                print(f"{'Net Total (Rs.)':<35}{total:<10}")
-            else:
-                print(f"Order #{order_number} is still active.")
-        else:
-            print(f"Order #{order_number} not found.")
-
-def parse_items_input(items_input):
-    items = {}
-    for item in items_input.split(','):
-        item = item.strip()
-        parts = item.split()
-
-        # If item has no quantity, prompt for quantity
-        if len(parts) == 1:
-            item_name = parts[0].lower()
-            while True:
-                try:
-                    quantity = int(input(f"Enter quantity for {item_name.capitalize()}: "))
-                    break
-                except ValueError:
-                    print("Invalid input. Please enter a valid number.")
-        else:
-            item_name, quantity = parts[0].lower(), int(parts[1])
-
-        items[item_name] = quantity
-    return items
-
-def main():
-    cafe = Cafe()
-    while True:
-        print("\nBiscotti Cafe Order System")
-        print("1. Open order for a table")
-        print("2. Add items to order")
-        print("3. Close order")
-        print("4. View completed orders")
-        print("5. View order summary")
-        print("6. Exit")
-        choice = input("Enter your choice: ")
-
-        try:
-            if choice == '1':
-                table_number = int(input("Enter table number (1-6): "))
-                cafe.open_order(table_number)
-            elif choice == '2':
-                table_number = int(input("Enter table number (1-6): "))
-                items_input = input("Enter items and quantities (e.g. Coffee 2, Tea 1): ")
-                items = parse_items_input(items_input)
-                cafe.add_items_to_order(table_number, items)
-            elif choice == '3':
-                table_number = int(input("Enter table number (1-6): "))
-                cafe.close_order(table_number)
-            elif choice == '4':
-                cafe.view_past_orders()
-            elif choice == '5':
-                order_number = int(input("Enter order number: "))
-                cafe.view_order_summary(order_number)
-            elif choice == '6':
-                print("Exiting the system. Thank you!")
-                break
-            else:
-                print("Invalid choice, please try again.")
-        except ValueError:
-            print("Invalid input. Please enter valid data.")
-
-if __name__ == "__main__":
-    main()
+import os
+import re
+import sys
+import time
+
+import orjson
+from array import array
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Define the menu as parallel name/price sequences; items are referred to
+# by their index so quantity bookkeeping stays hash-free.
+MENU_NAMES = ("coffee", "tea", "sandwich", "burger", "fries", "cake")
+MENU_PRICES = array('i', [250, 50, 200, 350, 100, 500])  # prices in Rs.
+NAME_TO_ID = {name: item_id for item_id, name in enumerate(MENU_NAMES)}
+
+# Common spellings mapped to their canonical menu name, so lookups on
+# "coffee" / "Coffee" / "COFFEE" need no lowercased copy of the input.
+_MENU_CI = {name: name for name in MENU_NAMES}
+_MENU_CI.update({name.upper(): name for name in MENU_NAMES})
+_MENU_CI.update({name.capitalize(): name for name in MENU_NAMES})
+
+# Tax configuration: 9% CGST and SGST each, computed in integer rupees so
+# receipts and the JSON on disk never carry float rounding noise.
+CGST_NUM = 9
+SGST_NUM = 9
+TAX_DENOM = 100
+PACKAGING_COST = 20  # Flat packaging cost for takeout
+# Persistence: active orders are tiny and rewritten per mutation; closed
+# orders are immutable and appended to the archive exactly once. The legacy
+# single-snapshot files are still read for migration.
+ACTIVE_FILE = 'active.json'
+ARCHIVE_FILE = 'archive.jsonl'
+DATA_FILE = 'orders.json'
+LOG_FILE = 'orders.log'
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Receipt formatting: one precompiled template per line shape, bound to
+# format_map so rows are rendered from a dict without re-parsing the widths;
+# receipts are assembled in a buffer and written with a single stdout call.
+ROW_FMT = "{item:<10}{qty:<10}{unit:<15}{tot:<10}\n".format_map
+LABEL_FMT = "{label:<35}{value:<10}\n".format_map
+RULE = "-" * 50 + "\n"
+
+# Accepted answers for the packaging prompt.
+_PKG_MAP = {"yes": True, "y": True, "no": False, "n": False}
+
+def _read_piped(prompt=''):
+    # stdin is redirected: read lines directly, skipping prompt rendering
+    # and the per-call flush input() performs.
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+_READ = input if sys.stdin.isatty() else _read_piped
+
+def _batch_totals(subtotals, packaging):
+    # Tax/total arithmetic over whole arrays; compiled by numba when present.
+    cgst = subtotals * CGST_NUM // TAX_DENOM
+    sgst = subtotals * SGST_NUM // TAX_DENOM
+    totals = subtotals + cgst + sgst + packaging * PACKAGING_COST
+    return totals, cgst, sgst
+
+if njit is not None:
+    # cache=True persists the compiled kernel on disk so later runs skip the
+    # compile cost.
+    _batch_totals = njit(cache=True, fastmath=True)(_batch_totals)
+
+class Order:
+    __slots__ = ('table_number', 'order_number', 'items', 'is_active',
+                 'include_packaging', 'order_time_epoch', '_subtotal')
+
+    def __init__(self, table_number, order_number):
+        self.table_number = table_number
+        self.order_number = order_number
+        self.items = array('i', [0] * len(MENU_NAMES))  # quantity per menu item id
+        self.is_active = True
+        self.include_packaging = False
+        self.order_time_epoch = time.time()
+        self._subtotal = 0
+
+    @property
+    def order_time(self):
+        # Formatted lazily: the timestamp is only rendered for receipts and
+        # listings, not on every Order construction.
+        return datetime.fromtimestamp(self.order_time_epoch).strftime(TIME_FORMAT)
+
+    def add_items(self, items):
+        for item_name, quantity in items.items():
+            canon = _MENU_CI.get(item_name) or _MENU_CI.get(item_name.lower())
+            if canon is not None:
+                item_id = NAME_TO_ID[canon]
+                self.items[item_id] += quantity
+                self._subtotal += MENU_PRICES[item_id] * quantity
+                print(f"Added {quantity} {canon}(s) to the order.")
+            else:
+                print(f"{item_name.capitalize()} is not available on the menu.")
+
+    def items_by_name(self):
+        return {MENU_NAMES[item_id]: quantity for item_id, quantity in enumerate(self.items) if quantity}
+
+    def _asdict(self):
+        # vars() is unavailable with __slots__; serialize the public fields,
+        # flattening the quantity array to a name -> quantity mapping.
+        return {
+            "table_number": self.table_number,
+            "order_number": self.order_number,
+            "items": self.items_by_name(),
+            "is_active": self.is_active,
+            "include_packaging": self.include_packaging,
+            "order_time_epoch": self.order_time_epoch,
+        }
+
+    def calculate_subtotal(self):
+        return self._subtotal
+
+    def calculate_taxes(self, subtotal):
+        cgst = subtotal * CGST_NUM // TAX_DENOM
+        sgst = subtotal * SGST_NUM // TAX_DENOM
+        return cgst, sgst
+
+    def calculate_total(self):
+        subtotal = self.calculate_subtotal()
+        cgst, sgst = self.calculate_taxes(subtotal)
+        total = subtotal + cgst + sgst
+        if self.include_packaging:
+            total += PACKAGING_COST
+        return total, cgst, sgst
+
+    def close_order(self):
+        self.is_active = False
+        subtotal = self.calculate_subtotal()
+        total, cgst, sgst = self.calculate_total()
+
+        buf = [f"Order #{self.order_number} for table {self.table_number} closed at {datetime.now()}.\n\n"]
+        buf.append(f"Summary for Table {self.table_number}:\n")
+        buf.append(ROW_FMT({"item": "Item", "qty": "Quantity", "unit": "Unit Price (Rs.)", "tot": "Total (Rs.)"}))
+        buf.append(RULE)
+        for item_id, quantity in enumerate(self.items):
+            if not quantity:
+                continue
+            unit_price = MENU_PRICES[item_id]
+            buf.append(ROW_FMT({"item": MENU_NAMES[item_id].capitalize(), "qty": quantity,
+                                "unit": unit_price, "tot": unit_price * quantity}))
+        buf.append(RULE)
+        buf.append(LABEL_FMT({"label": "Subtotal (Rs.)", "value": subtotal}))
+        buf.append(LABEL_FMT({"label": "CGST (9%) (Rs.)", "value": cgst}))
+        buf.append(LABEL_FMT({"label": "SGST (9%) (Rs.)", "value": sgst}))
+        if self.include_packaging:
+            buf.append(LABEL_FMT({"label": "Packaging Cost (Rs.)", "value": PACKAGING_COST}))
+        buf.append(RULE)
+        buf.append(LABEL_FMT({"label": "Net Total (Rs.)", "value": total}))
+        sys.stdout.write("".join(buf))
+
+class Cafe:
+    def __init__(self, num_tables=6):
+        self.tables = [None] * num_tables  # slot i holds table i+1's active order
+        self.orders = {}
+        self.next_order_number = 1
+        self._dirty = set()
+        self._past_cache = None  # formatted view_past_orders output
+        self.load_orders()
+
+    def validate_table_number(self, table_number):
+        if table_number < 1 or table_number > 6:
+            print("Invalid table number. Enter a table number between 1 and 6.")
+            return False
+        return True
+
+    def open_order(self, table_number):
+        if not self.validate_table_number(table_number):
+            return
+        if self.tables[table_number - 1] is None:
+            order = Order(table_number, self.next_order_number)
+            self.tables[table_number - 1] = order
+            self.orders[self.next_order_number] = order
+            print(f"Opened new order for table {table_number} with Order #{self.next_order_number}.")
+            self._dirty.add(self.next_order_number)
+            self.next_order_number += 1
+            self.save_orders()
+        else:
+            print(f"Table {table_number} already has an active order.")
+
+    def add_items_to_order(self, table_number, items):
+        if not self.validate_table_number(table_number):
+            return
+        order = self.tables[table_number - 1]
+        if order is not None and order.is_active:
+            order.add_items(items)
+            self._dirty.add(order.order_number)
+            self.save_orders()
+        else:
+            print(f"No active order for table {table_number} to add items to.")
+
+    def close_order(self, table_number):
+        if not self.validate_table_number(table_number):
+            return
+        order = self.tables[table_number - 1]
+        if order is not None and order.is_active:
+            while True:
+                packaging_choice = _PKG_MAP.get(_READ("Do you want packaging for this order (yes/no)? ").strip().lower())
+                if packaging_choice is not None:
+                    order.include_packaging = packaging_choice
+                    break
+                print("Invalid input. Please enter 'yes' or 'no'.")
+            order.close_order()
+            self.tables[table_number - 1] = None
+            self._past_cache = None
+            self._dirty.add(order.order_number)
+            self.archive_order(order)
+            self.save_orders()
+        else:
+            print(f"No active order for table {table_number} to close.")
+
+    def save_orders(self):
+        # Only active orders ever change, so each mutation rewrites a file
+        # bounded by the table count rather than the whole order history.
+        if not self._dirty:
+            return
+        payload = {order_number: order._asdict()
+                   for order_number, order in self.orders.items() if order.is_active}
+        with open(ACTIVE_FILE, 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS))
+        self._dirty.clear()
+
+    def archive_order(self, order):
+        with open(ARCHIVE_FILE, 'ab') as f:
+            f.write(orjson.dumps(order._asdict()) + b'\n')
+
+    def pretty_dump(self):
+        # Inspection helper: the data files are written compact, so indent
+        # only when a human asks to read the state.
+        payload = {order_number: order._asdict() for order_number, order in self.orders.items()}
+        sys.stdout.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode() + "\n")
+
+    def _restore_order(self, order_number, order_data):
+        order = Order(order_data['table_number'], order_number)
+        for item_name, quantity in order_data['items'].items():
+            order.items[NAME_TO_ID[item_name]] = quantity
+        order.is_active = order_data['is_active']
+        order.include_packaging = order_data['include_packaging']
+        if 'order_time_epoch' in order_data:
+            # float() also normalizes the Decimal values ijson produces.
+            order.order_time_epoch = float(order_data['order_time_epoch'])
+        else:
+            # Files written before timestamps were stored as epochs.
+            order.order_time_epoch = datetime.strptime(order_data['order_time'], TIME_FORMAT).timestamp()
+        self.orders[order_number] = order
+        table_slot = order_data['table_number'] - 1
+        occupant = self.tables[table_slot]
+        if order.is_active:
+            self.tables[table_slot] = order
+        elif occupant is not None and occupant.order_number == order_number:
+            # A log replay closed the order restored from the snapshot.
+            self.tables[table_slot] = None
+
+    def _load_snapshot(self, path):
+        # Restore a {order_number: order} JSON document, streaming it with
+        # ijson when available so only one order dict is in memory at a time.
+        try:
+            with open(path, 'rb') as f:
+                if ijson is not None:
+                    for order_number, order_data in ijson.kvitems(f, ''):
+                        self._restore_order(int(order_number), order_data)
+                else:
+                    for order_number, order_data in orjson.loads(f.read()).items():
+                        self._restore_order(int(order_number), order_data)
+        except FileNotFoundError:
+            pass
+
+    def load_orders(self):
+        if os.path.exists(ARCHIVE_FILE) or os.path.exists(ACTIVE_FILE):
+            try:
+                with open(ARCHIVE_FILE, 'rb') as f:
+                    for line in f:
+                        order_data = orjson.loads(line)
+                        self._restore_order(order_data['order_number'], order_data)
+            except FileNotFoundError:
+                pass
+            self._load_snapshot(ACTIVE_FILE)
+        else:
+            # Migrate from the legacy single snapshot plus delta log.
+            self._load_snapshot(DATA_FILE)
+            try:
+                with open(LOG_FILE, 'rb') as f:
+                    for line in f:
+                        entry = orjson.loads(line)
+                        self._restore_order(entry['n'], entry['order'])
+            except FileNotFoundError:
+                pass
+            # One-time migration to the split layout: closed orders go to the
+            # archive, active ones seed the new active file.
+            for order in self.orders.values():
+                if not order.is_active:
+                    self.archive_order(order)
+            self._dirty.update(order_number for order_number, order in self.orders.items() if order.is_active)
+            self.save_orders()
+        self.recompute_all_subtotals()
+        self.next_order_number = max(self.orders.keys(), default=0) + 1
+
+    def recompute_all_subtotals(self):
+        # Batch path: one matrix-vector product covers every order instead of
+        # a Python loop per order. Falls back to plain Python without numpy.
+        orders = list(self.orders.values())
+        if not orders:
+            return
+        if np is not None:
+            quantities = np.array([order.items for order in orders], dtype=np.int32)
+            prices = np.array(MENU_PRICES, dtype=np.int32)
+            for order, subtotal in zip(orders, quantities @ prices):
+                order._subtotal = int(subtotal)
+        else:
+            for order in orders:
+                order._subtotal = sum(price * quantity for price, quantity in zip(MENU_PRICES, order.items))
+
+    def compute_all_totals(self):
+        # Batch companion to Order.calculate_total: returns
+        # {order_number: (total, cgst, sgst)} for every order in one pass.
+        if np is not None and self.orders:
+            subtotals = np.array([order._subtotal for order in self.orders.values()], dtype=np.int64)
+            packaging = np.array([order.include_packaging for order in self.orders.values()], dtype=np.int64)
+            totals, cgst, sgst = _batch_totals(subtotals, packaging)
+            return dict(zip(self.orders.keys(), zip(totals.tolist(), cgst.tolist(), sgst.tolist())))
+        return {order_number: order.calculate_total() for order_number, order in self.orders.items()}
+
+    def view_past_orders(self):
+        # The listing only changes when an order closes, so keep the formatted
+        # text around and rebuild it on demand.
+        if self._past_cache is None:
+            lines = ["\nCompleted Orders:\n"]
+            for order_number, order in self.orders.items():
+                if not order.is_active:
+                    lines.append(f"Order #{order_number} for Table {order.table_number} placed on {order.order_time}\n")
+            self._past_cache = "".join(lines)
+        sys.stdout.write(self._past_cache)
+
+    def view_order_summary(self, order_number):
+        if order_number in self.orders:
+            order = self.orders[order_number]
+            if not order.is_active:
+                buf = [f"\nSummary for Order #{order_number}:\n"]
+                buf.append(f"Table: {order.table_number}\n")
+                buf.append(f"Date & Time: {order.order_time}\n")
+                buf.append(ROW_FMT({"item": "Item", "qty": "Quantity", "unit": "Unit Price (Rs.)", "tot": "Total (Rs.)"}))
+                buf.append(RULE)
+                for item_id, quantity in enumerate(order.items):
+                    if not quantity:
+                        continue
+                    unit_price = MENU_PRICES[item_id]
+                    buf.append(ROW_FMT({"item": MENU_NAMES[item_id].capitalize(), "qty": quantity,
+                                        "unit": unit_price, "tot": unit_price * quantity}))
+                subtotal = order.calculate_subtotal()
+                total, cgst, sgst = order.calculate_total()
+                if order.include_packaging:
+                    buf.append(LABEL_FMT({"label": "Packaging Cost (Rs.)", "value": PACKAGING_COST}))
+                buf.append(RULE)
+                buf.append(LABEL_FMT({"label": "Subtotal (Rs.)", "value": subtotal}))
+                buf.append(LABEL_FMT({"label": "CGST (9%) (Rs.)", "value": cgst}))
+                buf.append(LABEL_FMT({"label": "SGST (9%) (Rs.)", "value": sgst}))
+                buf.append(LABEL_FMT({"label": "Net Total (Rs.)", "value": total}))
+                sys.stdout.write("".join(buf))
+            else:
+                print(f"Order #{order_number} is still active.")
+        else:
+            print(f"Order #{order_number} not found.")
+
+# Matches one "name [quantity]" token; compiled once at import time so the
+# whole input is tokenized in a single finditer pass.
+_ITEM_RE = re.compile(r"([A-Za-z]+)(?:\s+(\d+))?")
+
+def _ask_quantity(item_name):
+    while True:
+        try:
+            return int(_READ(f"Enter quantity for {item_name.capitalize()}: "))
+        except ValueError:
+            print("Invalid input. Please enter a valid number.")
+
+def parse_items_input(items_input):
+    items = {}
+    for match in _ITEM_RE.finditer(items_input):
+        item_name = match.group(1).lower()
+        # If item has no quantity, prompt for quantity
+        quantity = int(match.group(2)) if match.group(2) else _ask_quantity(item_name)
+        items[item_name] = quantity
+    return items
+
+def main():
+    cafe = Cafe()
+    while True:
+        print("\nBiscotti Cafe Order System")
+        print("1. Open order for a table")
+        print("2. Add items to order")
+        print("3. Close order")
+        print("4. View completed orders")
+        print("5. View order summary")
+        print("6. Dump all orders")
+        print("7. Exit")
+        choice = _READ("Enter your choice: ")
+
+        try:
+            if choice == '1':
+                table_number = int(_READ("Enter table number (1-6): "))
+                cafe.open_order(table_number)
+            elif choice == '2':
+                table_number = int(_READ("Enter table number (1-6): "))
+                items_input = _READ("Enter items and quantities (e.g. Coffee 2, Tea 1): ")
+                items = parse_items_input(items_input)
+                cafe.add_items_to_order(table_number, items)
+            elif choice == '3':
+                table_number = int(_READ("Enter table number (1-6): "))
+                cafe.close_order(table_number)
+            elif choice == '4':
+                cafe.view_past_orders()
+            elif choice == '5':
+                order_number = int(_READ("Enter order number: "))
+                cafe.view_order_summary(order_number)
+            elif choice == '6':
+                cafe.pretty_dump()
+            elif choice == '7':
+                print("Exiting the system. Thank you!")
+                break
+            else:
+                print("Invalid choice, please try again.")
+        except ValueError:
+            print("Invalid input. Please enter valid data.")
+
+if __name__ == "__main__":
+    main()